@@ -7,6 +7,8 @@
     'use strict';
 
     const ARCHIVE_DIR = 'assets/data/archive';
+    const INDEX_URL = 'assets/data/insights-data.index.json';
+    const SCHEMA_VERSION = 1;
     const DAYS_TO_LOAD = 30; // 加载最近30天的归档
 
     /**
@@ -24,10 +26,28 @@
     }
 
     /**
-     * 加载单个归档文件
+     * 加载共享索引（失败或版本不匹配时返回null）
      */
-    async function loadArchiveFile(date) {
-        const url = `${ARCHIVE_DIR}/${date}.json`;
+    async function loadIndex() {
+        try {
+            const response = await fetch(INDEX_URL);
+            if (response.ok) {
+                const index = await response.json();
+                if (index.schema_version === SCHEMA_VERSION && index.archive && Array.isArray(index.archive.dates)) {
+                    return index;
+                }
+            }
+        } catch (e) {
+            // 索引不存在，使用逐日加载
+        }
+        return null;
+    }
+
+    /**
+     * 加载单个归档文件（指定lang时加载分语言版本）
+     */
+    async function loadArchiveFile(date, lang) {
+        const url = lang ? `${ARCHIVE_DIR}/${date}.${lang}.json` : `${ARCHIVE_DIR}/${date}.json`;
         try {
             const response = await fetch(url);
             if (response.ok) {
@@ -90,13 +110,13 @@
 
         // 渲染政策类新闻（区域与政策观察）
         if (archiveData.recent_observations) {
+            // 合并所有地区（地区由抓取脚本的地区路由表决定）
             const allPolicy = [];
-            if (archiveData.recent_observations['马来西亚'] && Array.isArray(archiveData.recent_observations['马来西亚'])) {
-                allPolicy.push(...archiveData.recent_observations['马来西亚']);
-            }
-            if (archiveData.recent_observations['新加坡'] && Array.isArray(archiveData.recent_observations['新加坡'])) {
-                allPolicy.push(...archiveData.recent_observations['新加坡']);
-            }
+            Object.values(archiveData.recent_observations).forEach(items => {
+                if (Array.isArray(items)) {
+                    allPolicy.push(...items);
+                }
+            });
 
             console.log(`准备渲染 ${allPolicy.length} 条政策类新闻到第一个容器（区域与政策观察）`);
             
@@ -149,8 +169,8 @@
         }
         
         // 如果没有数据，显示提示
-        const totalPolicy = (archiveData.recent_observations?.['马来西亚']?.length || 0) + 
-                            (archiveData.recent_observations?.['新加坡']?.length || 0);
+        const totalPolicy = Object.values(archiveData.recent_observations || {})
+            .reduce((sum, items) => sum + (items?.length || 0), 0);
         const totalIndustry = archiveData.industry_observations?.length || 0;
         
         if (totalPolicy === 0 && totalIndustry === 0) {
@@ -166,7 +186,16 @@
      * 加载并合并所有归档文件
      */
     async function loadArchives() {
-        const dates = getDateRange(DAYS_TO_LOAD);
+        let dates = getDateRange(DAYS_TO_LOAD);
+        let lang = null;
+        
+        // 有索引时只请求存在的归档日期，并只下载当前语言的数据
+        const index = await loadIndex();
+        if (index) {
+            const available = new Set(index.archive.dates);
+            dates = dates.filter(date => available.has(date));
+            lang = getCurrentLanguage();
+        }
         const allArchives = {
             recent_observations: {
                 马来西亚: [],
@@ -178,7 +207,7 @@
         console.log(`开始加载最近 ${DAYS_TO_LOAD} 天的归档...`);
 
         // 并行加载所有归档文件
-        const promises = dates.map(date => loadArchiveFile(date));
+        const promises = dates.map(date => loadArchiveFile(date, lang));
         const results = await Promise.all(promises);
 
         // 合并所有归档数据
@@ -191,14 +220,15 @@
                 const industryCount = archive.industry_observations?.length || 0;
                 console.log(`✓ 加载归档: ${dates[index]} (政策类: ${malaysiaCount + singaporeCount} 条, 行业类: ${industryCount} 条)`);
                 
-                // 合并政策类新闻（区域与政策观察）
+                // 合并政策类新闻（区域与政策观察，包括路由表新增的地区）
                 if (archive.recent_observations) {
-                    if (archive.recent_observations['马来西亚']) {
-                        allArchives.recent_observations['马来西亚'].push(...archive.recent_observations['马来西亚']);
-                    }
-                    if (archive.recent_observations['新加坡']) {
-                        allArchives.recent_observations['新加坡'].push(...archive.recent_observations['新加坡']);
-                    }
+                    Object.entries(archive.recent_observations).forEach(([region, items]) => {
+                        if (!Array.isArray(items)) return;
+                        if (!allArchives.recent_observations[region]) {
+                            allArchives.recent_observations[region] = [];
+                        }
+                        allArchives.recent_observations[region].push(...items);
+                    });
                 }
 
                 // 合并行业观察
@@ -222,8 +252,7 @@
             return dateB.localeCompare(dateA);
         };
 
-        allArchives.recent_observations['马来西亚'].sort(sortByDate);
-        allArchives.recent_observations['新加坡'].sort(sortByDate);
+        Object.values(allArchives.recent_observations).forEach(items => items.sort(sortByDate));
         allArchives.industry_observations.sort(sortByDate);
 
         // 渲染数据
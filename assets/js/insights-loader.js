@@ -8,6 +8,12 @@
     'use strict';
 
     const DATA_URL = 'assets/data/insights-data.json';
+    const DATA_DIR = 'assets/data';
+    const INDEX_URL = 'assets/data/insights-data.index.json';
+    const SCHEMA_VERSION = 1;
+    
+    // 共享索引（只加载一次，语言切换时复用）
+    let indexPromise = null;
     
     /**
      * 获取当前语言
@@ -111,20 +117,110 @@
         console.log('渲染完成:', containerId, '已添加', items.length, '条');
     }
 
+    /**
+     * 获取地区的新闻容器（ul[data-region]）；页面中没有的地区自动添加一列
+     */
+    function getRegionContainer(grid, region) {
+        if (!grid) return null;
+        const existing = Array.from(grid.querySelectorAll('ul[data-region]'))
+            .find(ul => ul.getAttribute('data-region') === region);
+        if (existing) return existing;
+        
+        const column = document.createElement('div');
+        column.className = 'observations-column';
+        const heading = document.createElement('h3');
+        heading.textContent = region;
+        const container = document.createElement('ul');
+        container.className = 'motion-group-container';
+        container.setAttribute('data-region', region);
+        column.appendChild(heading);
+        column.appendChild(container);
+        grid.appendChild(column);
+        return container;
+    }
+
+    /**
+     * 渲染近期观察的新闻项（链接 + 摘要tooltip）
+     */
+    function renderObservationItems(container, items) {
+        items.forEach(item => {
+            const li = document.createElement('li');
+            li.className = 'motion-group-item';
+            const a = document.createElement('a');
+            a.href = item.link || '#';
+            a.target = '_blank';
+            a.rel = 'noopener noreferrer';
+            a.textContent = getTextByLanguage(item);
+            
+            li.appendChild(a);
+            
+            // 添加摘要tooltip（必须在a之后添加，这样tooltip才能正确定位）
+            const summary = getSummaryByLanguage(item);
+            if (summary) {
+                const tooltip = document.createElement('div');
+                tooltip.className = 'news-item-tooltip';
+                // 清理HTML标签，只显示纯文本
+                const cleanSummary = summary.replace(/<[^>]*>/g, '').trim();
+                if (cleanSummary) {
+                    tooltip.textContent = cleanSummary;
+                    li.appendChild(tooltip);
+                }
+            }
+            container.appendChild(li);
+            // 立即添加 visible 类，确保元素可见
+            requestAnimationFrame(() => {
+                li.classList.add('visible');
+            });
+        });
+    }
+
+    /**
+     * 加载共享索引（失败或版本不匹配时返回null）
+     */
+    function loadIndex() {
+        if (!indexPromise) {
+            indexPromise = fetch(INDEX_URL)
+                .then(response => response.ok ? response.json() : null)
+                .then(index => (index && index.schema_version === SCHEMA_VERSION) ? index : null)
+                .catch(() => null);
+        }
+        return indexPromise;
+    }
+    
+    /**
+     * 获取新闻数据：优先只下载当前语言的文件，否则回退到双语文件
+     */
+    async function fetchInsightsData() {
+        const index = await loadIndex();
+        const entry = index && index.languages ? index.languages[getCurrentLanguage()] : null;
+        if (entry && entry.file) {
+            const url = `${DATA_DIR}/${entry.file}`;
+            console.log('开始加载新闻数据:', url);
+            const response = await fetch(url);
+            if (response.ok) {
+                return await response.json();
+            }
+            console.warn('分语言数据加载失败，回退到双语数据:', response.status);
+        }
+        
+        console.log('开始加载新闻数据:', DATA_URL);
+        const response = await fetch(DATA_URL);
+        if (!response.ok) {
+            console.error('新闻数据文件加载失败:', response.status, response.statusText);
+            return null;
+        }
+        return await response.json();
+    }
+
     /**
      * 加载并渲染新闻数据
      */
     async function loadInsightsData() {
         try {
-            console.log('开始加载新闻数据:', DATA_URL);
-            const response = await fetch(DATA_URL);
-            
-            if (!response.ok) {
-                console.error('新闻数据文件加载失败:', response.status, response.statusText);
+            const data = await fetchInsightsData();
+            if (!data) {
                 return; // 如果文件不存在，保持静态内容
             }
-
-            const data = await response.json();
             console.log('数据加载成功，数据结构:', {
                 has_recent_observations: !!data.recent_observations,
                 has_industry_observations: !!data.industry_observations,
@@ -133,112 +229,31 @@
             });
 
             // 检查容器元素
-            const malaysia = document.getElementById('malaysia-news');
-            const singapore = document.getElementById('singapore-news');
+            const recentGrid = document.getElementById('recent-observations');
             const industry = document.getElementById('industry-news');
             console.log('容器检查:', {
-                malaysia: !!malaysia,
-                singapore: !!singapore,
+                recent: !!recentGrid,
                 industry: !!industry
             });
 
-            // 渲染近期观察 - 使用与手动代码相同的逻辑
+            // 渲染近期观察：按数据中的地区逐个渲染（地区列表来自 data-sources.json 的 regions）
             if (data.recent_observations) {
                 console.log('开始渲染近期观察...');
                 
-                // 渲染马来西亚
-                if (malaysia) {
-                    console.log('马来西亚容器存在');
-                    if (data.recent_observations['马来西亚']) {
-                        console.log('马来西亚数据存在，数量:', data.recent_observations['马来西亚'].length);
-                        if (data.recent_observations['马来西亚'].length > 0) {
-                            malaysia.innerHTML = '';
-                            data.recent_observations['马来西亚'].forEach((item, index) => {
-                                const li = document.createElement('li');
-                                li.className = 'motion-group-item';
-                                const a = document.createElement('a');
-                                a.href = item.link || '#';
-                                a.target = '_blank';
-                                a.rel = 'noopener noreferrer';
-                                a.textContent = getTextByLanguage(item);
-                                
-                                li.appendChild(a);
-                                
-                                // 添加摘要tooltip（必须在a之后添加，这样tooltip才能正确定位）
-                                const summary = getSummaryByLanguage(item);
-                                if (summary) {
-                                    const tooltip = document.createElement('div');
-                                    tooltip.className = 'news-item-tooltip';
-                                    // 清理HTML标签，只显示纯文本
-                                    const cleanSummary = summary.replace(/<[^>]*>/g, '').trim();
-                                    if (cleanSummary) {
-                                        tooltip.textContent = cleanSummary;
-                                        li.appendChild(tooltip);
-                                    }
-                                }
-                                malaysia.appendChild(li);
-                                // 立即添加 visible 类，确保元素可见
-                                requestAnimationFrame(() => {
-                                    li.classList.add('visible');
-                                });
-                            });
-                            console.log('✓ 马来西亚已渲染:', data.recent_observations['马来西亚'].length, '条');
-                        } else {
-                            console.warn('马来西亚数据为空数组');
-                        }
-                    } else {
-                        console.warn('马来西亚数据不存在');
+                Object.entries(data.recent_observations).forEach(([region, items]) => {
+                    if (!items || items.length === 0) {
+                        console.warn(`${region}数据为空数组`);
+                        return; // 保持静态内容，新增地区不创建空列
                     }
-                } else {
-                    console.error('马来西亚容器不存在！');
-                }
-                
-                // 渲染新加坡
-                if (singapore) {
-                    console.log('新加坡容器存在');
-                    if (data.recent_observations['新加坡']) {
-                        console.log('新加坡数据存在，数量:', data.recent_observations['新加坡'].length);
-                        if (data.recent_observations['新加坡'].length > 0) {
-                            singapore.innerHTML = '';
-                            data.recent_observations['新加坡'].forEach((item, index) => {
-                                const li = document.createElement('li');
-                                li.className = 'motion-group-item';
-                                const a = document.createElement('a');
-                                a.href = item.link || '#';
-                                a.target = '_blank';
-                                a.rel = 'noopener noreferrer';
-                                a.textContent = getTextByLanguage(item);
-                                
-                                li.appendChild(a);
-                                
-                                // 添加摘要tooltip（必须在a之后添加，这样tooltip才能正确定位）
-                                const summary = getSummaryByLanguage(item);
-                                if (summary) {
-                                    const tooltip = document.createElement('div');
-                                    tooltip.className = 'news-item-tooltip';
-                                    // 清理HTML标签，只显示纯文本
-                                    const cleanSummary = summary.replace(/<[^>]*>/g, '').trim();
-                                    if (cleanSummary) {
-                                        tooltip.textContent = cleanSummary;
-                                        li.appendChild(tooltip);
-                                    }
-                                }
-                                singapore.appendChild(li);
-                                // 立即添加 visible 类，确保元素可见
-                                requestAnimationFrame(() => {
-                                    li.classList.add('visible');
-                                });
-                            });
-                            console.log('✓ 新加坡已渲染:', data.recent_observations['新加坡'].length, '条');
-                        } else {
-                            console.warn('新加坡数据为空数组');
-                        }
-                    } else {
-                        console.warn('新加坡数据不存在');
+                    const container = getRegionContainer(recentGrid, region);
+                    if (!container) {
+                        console.error(`${region}容器不存在！`);
+                        return;
                     }
-                } else {
-                    console.error('新加坡容器不存在！');
-                }
+                    container.innerHTML = '';
+                    renderObservationItems(container, items);
+                    console.log(`✓ ${region}已渲染:`, items.length, '条');
+                });
             } else {
                 console.warn('没有 recent_observations 数据');
             }
@@ -302,17 +317,15 @@
         
         function tryLoad() {
             console.log('尝试查找容器元素...');
-            const malaysia = document.getElementById('malaysia-news');
-            const singapore = document.getElementById('singapore-news');
+            const recentGrid = document.getElementById('recent-observations');
             const industry = document.getElementById('industry-news');
             
             console.log('容器查找结果:', {
-                malaysia: !!malaysia,
-                singapore: !!singapore,
+                recent: !!recentGrid,
                 industry: !!industry
             });
             
-            if (malaysia && singapore && industry) {
+            if (recentGrid && industry) {
                 console.log('✓ 所有容器已找到，开始加载数据');
                 loadInsightsData();
             } else {
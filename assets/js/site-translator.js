@@ -69,11 +69,47 @@
         '#industry-news', // 行业观察（整个容器）
         '#malaysia-news *', // 排除所有子元素
         '#singapore-news *', // 排除所有子元素
-        '#industry-news *' // 排除所有子元素
+        '#industry-news *', // 排除所有子元素
+        '[data-region]', // 近期观察 - 其他地区（insights-loader.js 按数据自动添加）
+        '[data-region] *'
         // 注意：不再排除 nav a，因为导航链接需要被翻译
         // 注意：不再排除所有 .motion-group-container，因为活动页面和合作页面也需要翻译
     ];
 
+    // 构建时预翻译的静态词典（由 scripts/pretranslate-pages.py 生成）
+    const STATIC_TRANSLATIONS_DIR = 'assets/data/translations';
+    const STATIC_TRANSLATIONS_MANIFEST = `${STATIC_TRANSLATIONS_DIR}/manifest.json`;
+    let staticTranslationsPromise = null;
+
+    /**
+     * 规范化空白字符（与预翻译脚本的 normalize_text 保持一致）
+     */
+    function normalizeText(text) {
+        return text.replace(/\s+/g, ' ').trim();
+    }
+
+    /**
+     * 加载当前页面的静态翻译词典（只加载一次，失败时返回空词典）
+     * 只请求清单中列出的词典，没有词典的页面不会多发一次注定404的请求
+     */
+    function loadStaticTranslations() {
+        if (!staticTranslationsPromise) {
+            const fileName = window.location.pathname.split('/').pop() || 'index.html';
+            const page = fileName.endsWith('.html') ? fileName.slice(0, -5) : 'index';
+            staticTranslationsPromise = fetch(STATIC_TRANSLATIONS_MANIFEST)
+                .then(response => response.ok ? response.json() : null)
+                .then(manifest => {
+                    const file = manifest && manifest.pages ? manifest.pages[page] : null;
+                    if (!file) return null;
+                    return fetch(`${STATIC_TRANSLATIONS_DIR}/${file}`)
+                        .then(response => response.ok ? response.json() : null);
+                })
+                .then(data => (data && data.translations) || {})
+                .catch(() => ({}));
+        }
+        return staticTranslationsPromise;
+    }
+
     /**
      * 获取需要翻译的元素
      */
@@ -132,7 +168,7 @@
                     }
                     
                     // 检查是否在新闻容器内（洞察页面的新闻列表）
-                    if (el.closest('#malaysia-news') || el.closest('#singapore-news') || el.closest('#industry-news')) {
+                    if (el.closest('#malaysia-news') || el.closest('#singapore-news') || el.closest('#industry-news') || el.closest('[data-region]')) {
                         shouldExclude = true;
                     }
                     
@@ -246,6 +282,8 @@
         
         if (elements.length === 0) return;
         
+        const staticTranslations = await loadStaticTranslations();
+        
         // 分离需要翻译的元素和已有翻译的元素
         const elementsToTranslate = [];
         const elementsWithCache = [];
@@ -305,8 +343,8 @@
                 return; // 已有翻译，不再处理
             }
             
-            // 检查localStorage缓存（优先检查缓存，避免重复调用API）
-            const cachedTranslation = getCachedTranslation(text);
+            // 优先使用构建时预翻译的静态词典，其次检查localStorage缓存（避免重复调用API）
+            const cachedTranslation = staticTranslations[normalizeText(text)] || getCachedTranslation(text);
             if (cachedTranslation) {
                 // 有缓存，直接使用（固定内容只翻译一次）
                 el.setAttribute('data-original-text', text);
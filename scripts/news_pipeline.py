@@ -0,0 +1,1676 @@
+"""
+洞察页面新闻抓取流水线（可导入的API）
+
+抓取RSS → 关键词/AI筛选 → 分类 → 翻译 → 生成JSON数据文件。
+命令行入口是 scripts/fetch-news.py；其他工具（回填、基准测试、常驻进程）可以直接导入
+NewsPipeline，在同一进程中运行多次。
+
+导入本模块不做任何实际工作：feedparser 在第一次解析RSS时才导入，OpenAI客户端在第一次
+需要AI筛选或翻译时才创建；keyword_only=True 时完全不导入 openai。
+
+用法：
+    from news_pipeline import NewsPipeline
+
+    NewsPipeline().run()                                # 与 fetch-news.py 相同
+    NewsPipeline(keyword_only=True).collect()           # 只用关键词筛选，不写文件
+    NewsPipeline(config=config, fetcher=fake_fetcher, llm=fake_client).collect()
+"""
+
+import json
+import os
+import re
+import shutil
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+# 配置
+BASE_DIR = Path(__file__).parent.parent
+CONFIG_FILE = BASE_DIR / "data-sources.json"
+OUTPUT_FILE = BASE_DIR / "assets/data/insights-data.json"
+INDEX_FILE = BASE_DIR / "assets/data/insights-data.index.json"
+ARCHIVE_DIR = BASE_DIR / "assets/data/archive"
+TRENDS_FILE = BASE_DIR / "assets/data/trends.json"
+API_KEY_FILE = BASE_DIR / ".env"
+RUNS_DIR = BASE_DIR / ".runs"  # 阶段检查点（运行成功后删除）
+CHECKPOINT_MAX_AGE_DAYS = 2   # 超过该天数的检查点不再用于恢复
+
+# 分语言输出（insights-data.en.json / insights-data.zh.json + 共享索引）
+SCHEMA_VERSION = 1
+LANGUAGES = ['en', 'zh']
+
+
+def _import_feedparser():
+    """按需导入feedparser（只在解析RSS时需要）"""
+    try:
+        import feedparser
+    except ImportError:
+        raise ImportError("缺少必要的Python库 feedparser，请运行: pip install -r requirements.txt")
+    return feedparser
+
+
+def load_api_key() -> Optional[str]:
+    """读取OpenAI API密钥：优先环境变量（GitHub Actions使用），其次.env文件"""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key and API_KEY_FILE.exists():
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            raise ImportError("缺少必要的Python库 python-dotenv，请运行: pip install -r requirements.txt")
+        load_dotenv(API_KEY_FILE)
+        api_key = os.getenv("OPENAI_API_KEY")
+    return api_key
+
+
+def create_openai_client(api_key: Optional[str] = None):
+    """创建OpenAI客户端；没有API密钥时返回None（只使用关键词筛选）"""
+    api_key = api_key or load_api_key()
+    if not api_key:
+        print("⚠ 未找到OPENAI_API_KEY，将仅使用关键词筛选")
+        return None
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("缺少必要的Python库 openai，请运行: pip install -r requirements.txt")
+    print("✓ AI筛选已启用")
+    return OpenAI(api_key=api_key)
+
+
+def new_cost_tracker() -> Dict[str, int]:
+    """成本监控计数器（每次运行一份）"""
+    return {
+        'ai_filter_calls': 0,
+        'translation_calls': 0,
+        'total_input_tokens': 0,
+        'total_output_tokens': 0
+    }
+
+
+# gpt-4o-mini 价格：$0.15/1M input, $0.60/1M output
+INPUT_PRICE_PER_M = 0.15
+OUTPUT_PRICE_PER_M = 0.60
+
+
+def estimate_cost(input_tokens: int, output_tokens: int) -> float:
+    """估算API费用（美元）"""
+    return (input_tokens / 1_000_000) * INPUT_PRICE_PER_M + (output_tokens / 1_000_000) * OUTPUT_PRICE_PER_M
+
+
+class BudgetController:
+    """运行级预算控制（tokens、费用、运行时间）
+
+    接近上限时按顺序降级：
+    1) 跳过摘要翻译
+    2) 低优先级数据源只使用关键词筛选
+    3) 停止抓取和AI调用（同时跳过剩余翻译），已抓取的新闻只按关键词分类后输出
+    """
+
+    LEVELS = ['normal', 'skip_summary_translation', 'keyword_only_low_priority', 'stop_fetching']
+    DEFAULT_THRESHOLDS = {
+        'skip_summary_translation': 0.7,
+        'keyword_only_low_priority': 0.8,
+        'stop_fetching': 0.9
+    }
+
+    def __init__(self, budget_config: Optional[Dict] = None, cost_tracker: Optional[Dict] = None):
+        self.cost_tracker = cost_tracker if cost_tracker is not None else new_cost_tracker()
+        self.configure(budget_config or {})
+
+    def configure(self, budget_config: Dict) -> None:
+        """加载预算配置并开始计时（未配置的上限视为不限制）"""
+        self.max_tokens = budget_config.get('max_tokens')
+        self.max_usd = budget_config.get('max_usd')
+        self.max_seconds = budget_config.get('max_seconds')
+        self.low_priority_from = budget_config.get('low_priority_from', 2)
+        self.thresholds = self.DEFAULT_THRESHOLDS.copy()
+        self.thresholds.update(budget_config.get('degrade_thresholds', {}))
+        self.started_at = time.monotonic()
+        self.level = 0
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_seconds(self) -> Optional[float]:
+        if not self.max_seconds:
+            return None
+        return max(self.max_seconds - self.elapsed(), 0)
+
+    def usage_ratio(self) -> float:
+        """已用预算比例（取tokens、费用、时间中最高的一项）"""
+        tokens = self.cost_tracker['total_input_tokens'] + self.cost_tracker['total_output_tokens']
+        ratios = [0.0]
+        if self.max_tokens:
+            ratios.append(tokens / self.max_tokens)
+        if self.max_usd:
+            cost = estimate_cost(self.cost_tracker['total_input_tokens'], self.cost_tracker['total_output_tokens'])
+            ratios.append(cost / self.max_usd)
+        if self.max_seconds:
+            ratios.append(self.elapsed() / self.max_seconds)
+        return max(ratios)
+
+    def update(self) -> int:
+        """根据当前用量更新降级等级（只升不降），返回当前等级"""
+        ratio = self.usage_ratio()
+        for level in range(len(self.LEVELS) - 1, self.level, -1):
+            if ratio >= self.thresholds[self.LEVELS[level]]:
+                self.level = level
+                print(f"  ⚠ 预算已用 {ratio:.0%}，降级：{self.LEVELS[level]}")
+                break
+        return self.level
+
+    def allows_summary_translation(self) -> bool:
+        return self.update() < self.LEVELS.index('skip_summary_translation')
+
+    def allows_ai_filter(self, source: Dict) -> bool:
+        if source.get('priority', 999) < self.low_priority_from:
+            return True
+        return self.update() < self.LEVELS.index('keyword_only_low_priority')
+
+    def allows_fetching(self) -> bool:
+        return self.update() < self.LEVELS.index('stop_fetching')
+
+    def fetch_deadline(self) -> Optional[float]:
+        """抓取阶段不调用API，只有运行时间会增加：返回时间达到 stop_fetching 阈值的时刻
+        （time.monotonic），没有时间上限时返回None"""
+        if not self.max_seconds:
+            return None
+        return self.started_at + self.max_seconds * self.thresholds['stop_fetching']
+
+    def request_timeout(self, default: float = 30) -> float:
+        """单次请求超时：不超过剩余运行时间"""
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return default
+        return max(min(default, remaining), 1)
+
+    def record(self, response, call_type: str) -> None:
+        """记录一次OpenAI调用的用量"""
+        self.cost_tracker[f'{call_type}_calls'] += 1
+        usage = getattr(response, 'usage', None)
+        if usage:
+            self.cost_tracker['total_input_tokens'] += usage.prompt_tokens
+            self.cost_tracker['total_output_tokens'] += usage.completion_tokens
+        self.update()
+
+
+class RunCheckpoint:
+    """阶段检查点：每个阶段的结果写入运行目录，中断后可用 --resume 继续
+
+    阶段：fetched（各数据源的原始条目）、filtered（预筛选后的候选新闻）、
+    verdicts（AI筛选结果）、translations（翻译结果）。run_dir 为 None 时不做任何持久化。
+    """
+
+    STAGES = ['fetched', 'filtered', 'verdicts', 'translations']
+
+    def __init__(self, run_dir: Optional[Path] = None):
+        self.run_dir = run_dir
+        self.state = self.load('state', {'completed': []})
+
+    @classmethod
+    def start(cls, resume: bool = False) -> 'RunCheckpoint':
+        """开始新的运行，或恢复最近一次未完成的运行"""
+        RUNS_DIR.mkdir(parents=True, exist_ok=True)
+        run_dirs = sorted(d for d in RUNS_DIR.iterdir() if d.is_dir())
+        if resume and run_dirs:
+            latest = run_dirs[-1]
+            age = datetime.now() - datetime.fromtimestamp(latest.stat().st_mtime)
+            if age <= timedelta(days=CHECKPOINT_MAX_AGE_DAYS):
+                checkpoint = cls(latest)
+                completed = ', '.join(checkpoint.state['completed']) or '无'
+                print(f"✓ 从检查点恢复: {latest.name}（已完成阶段: {completed}）")
+                return checkpoint
+            print(f"⚠ 检查点 {latest.name} 已过期，重新开始")
+        elif resume:
+            print("⚠ 没有可恢复的检查点，重新开始")
+        # 新的运行：清除旧检查点
+        for run_dir in run_dirs:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        run_dir = RUNS_DIR / datetime.now().strftime("%Y%m%d-%H%M%S")
+        run_dir.mkdir(parents=True)
+        return cls(run_dir)
+
+    def load(self, name: str, default):
+        """读取阶段数据（不存在或损坏时返回default）"""
+        if not self.run_dir:
+            return default
+        path = self.run_dir / f"{name}.json"
+        if not path.exists():
+            return default
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠ 检查点 {path.name} 读取失败: {e}")
+            return default
+
+    def save(self, name: str, data) -> None:
+        """原子写入阶段数据（先写临时文件再替换，进程被杀也不会留下半个文件）"""
+        if not self.run_dir:
+            return
+        path = self.run_dir / f"{name}.json"
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def is_completed(self, stage: str) -> bool:
+        return stage in self.state['completed']
+
+    def mark_completed(self, stage: str) -> None:
+        if stage not in self.state['completed']:
+            self.state['completed'].append(stage)
+            self.save('state', self.state)
+
+    def finish(self) -> None:
+        """运行成功后删除检查点"""
+        if self.run_dir:
+            shutil.rmtree(self.run_dir, ignore_errors=True)
+
+
+def serialize_entry(entry: Dict) -> Dict:
+    """把RSS条目转换为可写入检查点的字典"""
+    parsed = entry.get('published_parsed')
+    return {
+        'title': entry.get('title', ''),
+        'link': entry.get('link', '#'),
+        'summary': extract_summary(entry),
+        'published': entry.get('published', ''),
+        'published_parsed': list(parsed) if parsed else None
+    }
+
+
+def deserialize_entry(data: Dict) -> Dict:
+    """从检查点恢复RSS条目"""
+    entry = _import_feedparser().FeedParserDict(data)
+    if data.get('published_parsed'):
+        entry['published_parsed'] = time.struct_time(data['published_parsed'])
+    return entry
+
+
+def serialize_item(item: Dict) -> Dict:
+    """新闻项中的datetime转换为ISO字符串"""
+    data = dict(item)
+    if data.get('date_obj'):
+        data['date_obj'] = data['date_obj'].isoformat()
+    return data
+
+
+def deserialize_item(data: Dict) -> Dict:
+    item = dict(data)
+    if item.get('date_obj'):
+        item['date_obj'] = datetime.fromisoformat(item['date_obj'])
+    return item
+
+
+def load_config() -> Dict:
+    """加载配置文件"""
+    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def format_date(date_str: str) -> str:
+    """格式化日期为 DD-MM-YY 格式（日-月-年）"""
+    try:
+        # 尝试解析各种日期格式（feedparser返回struct_time）
+        parsed = _import_feedparser()._parse_date(date_str)
+        return time.strftime("%d-%m-%y", parsed)
+    except:
+        return datetime.now().strftime("%d-%m-%y")
+
+
+def get_news_date(entry: Dict) -> Optional[datetime]:
+    """获取新闻的发布日期（datetime对象）"""
+    try:
+        # 优先使用published_parsed（更可靠）
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            from time import mktime
+            return datetime.fromtimestamp(mktime(entry.published_parsed))
+        # 如果没有published_parsed，尝试解析published字符串
+        published = entry.get('published', '')
+        if published:
+            # 尝试使用feedparser的parse方法
+            try:
+                return _import_feedparser()._parse_date(published)
+            except:
+                # 如果失败，尝试使用published_parsed（如果entry是feedparser对象）
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    from time import mktime
+                    return datetime.fromtimestamp(mktime(entry.published_parsed))
+    except Exception as e:
+        pass
+    return None
+
+
+def is_within_date_range(news_date: Optional[datetime], days: int = 0) -> bool:
+    """检查新闻日期是否在指定天数范围内（0=当天，1=昨天，2=前天）"""
+    if not news_date:
+        return False
+    
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    target_date = today - timedelta(days=days)
+    
+    # 检查是否是同一天（忽略时间）
+    return news_date.date() == target_date.date()
+
+
+# 流式解析默认参数（可在 data-sources.json 的 fetching 中覆盖）
+DEFAULT_FETCH_CONFIG = {
+    'streaming': True,          # 使用增量XML解析，逐条产出新闻
+    'window_days': 3,           # 选择窗口：当天、昨天、前天
+    'max_content_chars': 1000,  # 摘要/正文最多保留的字符数
+    'ordered_stop_after': 3,    # 按日期排序的源，连续遇到N条窗口外新闻后停止读取
+    'timeout': 30               # 单个RSS源的网络超时（秒）
+}
+
+
+def get_fetch_config(config: Dict) -> Dict:
+    """合并抓取配置与默认值"""
+    fetch_config = DEFAULT_FETCH_CONFIG.copy()
+    fetch_config.update(config.get('fetching', {}))
+    return fetch_config
+
+
+def get_window_start(window_days: int) -> datetime:
+    """计算选择窗口的起始时间（window_days=3 表示从前天0点开始）"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=max(window_days - 1, 0))
+
+
+def _local_name(tag: str) -> str:
+    """去掉XML命名空间，返回本地标签名"""
+    return tag.rsplit('}', 1)[-1].lower() if isinstance(tag, str) else ''
+
+
+# 条目字段只从这些命名空间读取（RSS无命名空间、Atom、RSS 1.0、content:、dc:），
+# 避免 media:title、itunes:summary 等扩展元素覆盖真正的标题和摘要
+FEED_NAMESPACES = {
+    '',
+    'http://www.w3.org/2005/Atom',
+    'http://purl.org/atom/ns#',
+    'http://purl.org/rss/1.0/',
+    'http://my.netscape.com/rdf/simple/0.9/',
+    'http://purl.org/rss/1.0/modules/content/',
+    'http://purl.org/dc/elements/1.1/',
+    'http://purl.org/dc/terms/'
+}
+
+
+def _field_name(tag: str) -> str:
+    """条目字段名：不属于 FEED_NAMESPACES 的扩展元素返回空字符串"""
+    if not isinstance(tag, str):
+        return ''
+    namespace = tag[1:].split('}', 1)[0] if tag.startswith('{') else ''
+    return _local_name(tag) if namespace in FEED_NAMESPACES else ''
+
+
+def _element_text(elem: ET.Element, max_chars: int) -> str:
+    """提取元素文本（包括xhtml子元素），并截断到max_chars"""
+    text = ''.join(elem.itertext()).strip()
+    return text[:max_chars]
+
+
+def _parse_entry_date(value: str) -> Optional[time.struct_time]:
+    """解析RSS/Atom日期，返回与feedparser一致的UTC struct_time"""
+    if not value:
+        return None
+    try:
+        # RSS pubDate（RFC 822）
+        return parsedate_to_datetime(value).utctimetuple()
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        # Atom published/updated（ISO 8601）
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).utctimetuple()
+    except ValueError:
+        pass
+    return _import_feedparser()._parse_date(value)
+
+
+def _build_entry(item: ET.Element, max_chars: int) -> Dict:
+    """把一个 <item>/<entry> 元素转换为类似feedparser的条目"""
+    entry = _import_feedparser().FeedParserDict()
+    for child in item:
+        name = _field_name(child.tag)
+        if name == 'title':
+            entry['title'] = _element_text(child, max_chars)
+        elif name == 'link':
+            # RSS: <link>url</link>；Atom: <link rel="alternate" href="url"/>
+            href = child.get('href')
+            if href is None:
+                entry.setdefault('link', (child.text or '').strip())
+            elif child.get('rel', 'alternate') == 'alternate':
+                entry.setdefault('link', href)
+        elif name in ('description', 'summary'):
+            entry['summary'] = _element_text(child, max_chars)
+        elif name in ('encoded', 'content'):
+            entry['content'] = [{'value': _element_text(child, max_chars)}]
+        elif name in ('pubdate', 'published', 'updated', 'date'):
+            # 优先使用发布时间，其次更新时间
+            if 'published' not in entry or name in ('pubdate', 'published'):
+                entry['published'] = (child.text or '').strip()
+    entry['published_parsed'] = _parse_entry_date(entry.get('published', ''))
+    return entry
+
+
+def _feed_request(url: str) -> Request:
+    """RSS请求（与feedparser使用相同的User-Agent）"""
+    return Request(url, headers={'User-Agent': _import_feedparser().USER_AGENT})
+
+
+def stream_feed_entries(url: str, fetch_config: Dict) -> Iterator[Dict]:
+    """增量解析RSS/Atom，逐条产出新闻；已处理的元素立即释放"""
+    max_chars = fetch_config['max_content_chars']
+    with urlopen(_feed_request(url), timeout=fetch_config['timeout']) as response:
+        stack = []
+        for event, elem in ET.iterparse(response, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) in ('item', 'entry'):
+                yield _build_entry(elem, max_chars)
+                # 从父节点移除，避免整棵树在内存中累积
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+
+def iter_feed_entries(url: str, fetch_config: Dict, window_start: datetime) -> Iterator[Dict]:
+    """逐条产出选择窗口内的新闻（无日期的新闻保留，交给后续逻辑处理）
+
+    对于按日期倒序排列的源，连续遇到 ordered_stop_after 条窗口外的新闻后停止读取；
+    非倒序的源逐条跳过窗口外新闻。XML解析失败时回退到 feedparser。
+    fetch_config 中的 deadline（time.monotonic）到达后不再回退，回退下载的超时也不超过 deadline。
+    """
+    def entries() -> Iterator[Dict]:
+        if fetch_config['streaming']:
+            try:
+                yield from stream_feed_entries(url, fetch_config)
+                return
+            except ET.ParseError as e:
+                # 不规范的XML（如未定义的HTML实体）交给feedparser容错解析
+                # 已产出的新闻会被调用方的URL去重跳过
+                print(f"  ⚠ 流式解析失败（{e}），回退到feedparser")
+        timeout = fetch_config['timeout']
+        deadline = fetch_config.get('deadline')
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"  ⚠ 预算即将用完，跳过feedparser解析")
+                return
+            timeout = max(min(timeout, remaining), 1)
+        # 先带超时下载，再交给feedparser解析（feedparser.parse(url) 没有超时）
+        with urlopen(_feed_request(url), timeout=timeout) as response:
+            body = response.read()
+        feed = _import_feedparser().parse(body)
+        if hasattr(feed, 'bozo') and feed.bozo:
+            print(f"  ⚠ RSS解析警告：{str(feed.bozo_exception) if hasattr(feed, 'bozo_exception') else '未知错误'}")
+        max_chars = fetch_config['max_content_chars']
+        for entry in feed.entries:
+            for key in ('title', 'summary', 'description'):
+                if key in entry:
+                    entry[key] = entry[key][:max_chars]
+            if 'content' in entry:
+                entry['content'] = [{'value': c.get('value', '')[:max_chars]} for c in entry['content'][:1]]
+            yield entry
+
+    ordered = True
+    last_date = None
+    old_streak = 0
+    for entry in entries():
+        news_date = get_news_date(entry)
+        if news_date is None:
+            yield entry
+            continue
+        if last_date is not None and news_date > last_date:
+            ordered = False
+        last_date = news_date
+        if news_date >= window_start:
+            old_streak = 0
+            yield entry
+            continue
+        old_streak += 1
+        if ordered and old_streak >= fetch_config['ordered_stop_after']:
+            print(f"  已到达选择窗口之外，停止读取该源")
+            return
+
+
+def extract_summary(entry: Dict) -> str:
+    """提取新闻摘要"""
+    if 'summary' in entry:
+        return entry['summary']
+    elif 'description' in entry:
+        return entry['description']
+    elif 'content' in entry and len(entry['content']) > 0:
+        return entry['content'][0].get('value', '')
+    return ''
+
+
+def check_keywords(text: str, keywords: List[str]) -> bool:
+    """检查文本是否包含关键词"""
+    text_lower = text.lower()
+    for keyword in keywords:
+        if keyword.lower() in text_lower:
+            return True
+    return False
+
+
+# 未配置 regions 时使用的默认地区表（新马两地）
+DEFAULT_REGIONS = {
+    "fallback": "马来西亚",
+    "table": [
+        {"name": "马来西亚", "aliases": ["malaysia", "马来西亚"]},
+        {"name": "新加坡", "aliases": ["singapore", "新加坡"]}
+    ]
+}
+
+
+class RegionRouter:
+    """地区路由表：所有地区的别名编译为一个正则，一次扫描即可把新闻路由到一个或多个地区"""
+
+    def __init__(self, region_config: Optional[Dict] = None, default_quota: int = 5):
+        region_config = region_config or DEFAULT_REGIONS
+        regions = [r for r in region_config.get('table', []) if r.get('enabled', True)]
+        self.names = [r['name'] for r in regions]
+        self.quotas = {r['name']: r.get('quota', default_quota) for r in regions}
+        self.fallback = region_config.get('fallback')
+        if self.fallback not in self.quotas:
+            self.fallback = None
+        
+        # 别名 -> 地区（地区名本身也作为别名）
+        self.alias_map = {}
+        for region in regions:
+            for alias in [region['name']] + region.get('aliases', []):
+                self.alias_map.setdefault(alias.lower(), region['name'])
+        # 长别名优先，避免被较短的别名截断
+        aliases = sorted(self.alias_map, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(a) for a in aliases), re.IGNORECASE) if aliases else None
+
+    def match(self, text: str) -> List[str]:
+        """返回文本中提到的地区（按首次出现顺序）"""
+        if not self.pattern or not text:
+            return []
+        matched = []
+        for m in self.pattern.finditer(text):
+            region = self.alias_map[m.group(0).lower()]
+            if region not in matched:
+                matched.append(region)
+        return matched
+
+    def route(self, source_region: str, title: str) -> List[str]:
+        """确定新闻所属地区：数据源本身属于某地区时直接使用；
+        区域性数据源（如东盟）根据标题匹配，未匹配时分配到默认地区"""
+        if source_region in self.quotas:
+            return [source_region]
+        return self.match(title) or ([self.fallback] if self.fallback else [])
+
+    def empty_observations(self) -> Dict[str, List]:
+        return {name: [] for name in self.names}
+
+
+def classify_industry(title: str, summary: str, industry_keywords: Dict) -> Optional[str]:
+    """根据关键词分类行业"""
+    text = f"{title} {summary}".lower()
+    for industry, keywords in industry_keywords.items():
+        if check_keywords(text, keywords):
+            return industry
+    return None
+
+
+CJK_PATTERN = re.compile(r'[\u3400-\u9fff\uf900-\ufaff]')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def is_chinese_text(text: str, min_ratio: float = 0.3) -> bool:
+    """判断文本是否已经是中文（汉字占全部文字字符的比例达到 min_ratio）；
+    不含任何文字的文本（数字、符号）也视为无需翻译"""
+    letters = [c for c in HTML_TAG_PATTERN.sub('', text) if c.isalpha()]
+    if not letters:
+        return True
+    cjk_count = sum(1 for c in letters if CJK_PATTERN.match(c))
+    return cjk_count / len(letters) >= min_ratio
+
+
+def route_translation_texts(texts: List[str]) -> Tuple[List[str], List[Optional[int]]]:
+    """翻译前的本地路由：跳过空文本和已是中文的文本，相同文本只保留一份
+
+    返回 (需要翻译的唯一文本, 每个原始位置对应的唯一文本下标)，下标为 None 表示保留原文。
+    """
+    unique_texts = []
+    unique_index = {}
+    positions = []
+    for text in texts:
+        if not text or not text.strip() or is_chinese_text(text):
+            positions.append(None)
+            continue
+        if text not in unique_index:
+            unique_index[text] = len(unique_texts)
+            unique_texts.append(text)
+        positions.append(unique_index[text])
+    return unique_texts, positions
+
+
+def generate_display_format(news_data: Dict) -> Dict:
+    """生成前端显示格式"""
+    formatted = {
+        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "recent_observations": {region: [] for region in news_data['recent_observations']},
+        "industry_observations": []
+    }
+    
+    # 格式化近期观察（政策类）
+    for region, items in news_data['recent_observations'].items():
+        for item in items:
+            title_zh = item.get('title_zh', item['title'])
+            summary_zh = item.get('summary_zh', item.get('summary', ''))
+            formatted['recent_observations'][region].append({
+                "text": f"[{item['date']} · {region}] {item['title']}",
+                "text_zh": f"[{item['date']} · {region}] {title_zh}",
+                "link": item['link'],
+                "summary": item.get('summary', ''),
+                "summary_zh": summary_zh,
+                # 元数据：用于归档和趋势统计（分语言文件中不包含）
+                "date": item['date'],
+                "region": region,
+                "industry": item.get('industry', '其他'),
+                "source": item.get('source', '')
+            })
+    
+    # 格式化行业观察
+    for item in news_data['industry_observations']:
+        # 处理可能没有industry字段的情况
+        industry = item.get('industry', '其他')
+        title_zh = item.get('title_zh', item['title'])
+        summary_zh = item.get('summary_zh', item.get('summary', ''))
+        formatted['industry_observations'].append({
+            "text": f"[{item['date']} · {industry}] {item['title']}",
+            "text_zh": f"[{item['date']} · {industry}] {title_zh}",
+            "link": item['link'],
+            "summary": item.get('summary', ''),
+            "summary_zh": summary_zh,
+            "date": item['date'],
+            "region": item.get('region', ''),
+            "industry": industry,
+            "source": item.get('source', '')
+        })
+    
+    return formatted
+
+
+def _split_item(item: Dict, lang: str) -> Dict:
+    """把双语新闻项转换为单语言新闻项（缺少译文时回退到原文）"""
+    if lang == 'zh':
+        text = item.get('text_zh') or item.get('text', '')
+        summary = item.get('summary_zh') or item.get('summary', '')
+    else:
+        text = item.get('text') or item.get('text_zh', '')
+        summary = item.get('summary') or item.get('summary_zh', '')
+    return {"text": text, "link": item.get('link', '#'), "summary": summary}
+
+
+def split_display_format(data: Dict, lang: str) -> Dict:
+    """从双语显示数据中提取单一语言的数据（其余顶层字段保持不变）"""
+    split = {key: value for key, value in data.items()
+             if key not in ('recent_observations', 'industry_observations')}
+    split['schema_version'] = SCHEMA_VERSION
+    split['lang'] = lang
+    split['recent_observations'] = {
+        region: [_split_item(item, lang) for item in items]
+        for region, items in data.get('recent_observations', {}).items()
+    }
+    split['industry_observations'] = [
+        _split_item(item, lang) for item in data.get('industry_observations', [])
+    ]
+    return split
+
+
+def split_file_path(path: Path, lang: str) -> Path:
+    """insights-data.json -> insights-data.en.json"""
+    return path.with_name(f"{path.stem}.{lang}{path.suffix}")
+
+
+def write_json(path: Path, data: Dict, compact: bool = False) -> None:
+    """写入JSON文件（分语言文件使用紧凑格式以减小体积）"""
+    with open(path, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def write_split_files(data: Dict, path: Path) -> Dict:
+    """写入每种语言的数据文件，返回索引中的语言条目"""
+    languages = {}
+    for lang in LANGUAGES:
+        lang_path = split_file_path(path, lang)
+        write_json(lang_path, split_display_format(data, lang), compact=True)
+        languages[lang] = {"file": lang_path.name}
+    return languages
+
+
+def ensure_split_archives() -> List[str]:
+    """为归档文件补齐分语言版本，返回所有归档日期（最新的在前）"""
+    dates = []
+    if not ARCHIVE_DIR.exists():
+        return dates
+    for archive_file in ARCHIVE_DIR.glob("????-??-??.json"):
+        dates.append(archive_file.stem)
+        if all(split_file_path(archive_file, lang).exists() for lang in LANGUAGES):
+            continue
+        try:
+            with open(archive_file, 'r', encoding='utf-8') as f:
+                archive_data = json.load(f)
+            write_split_files(archive_data, archive_file)
+        except Exception as e:
+            print(f"⚠ 生成分语言归档失败 {archive_file.name}: {e}")
+    return sorted(dates, reverse=True)
+
+
+def write_index_file(data: Dict, languages: Dict, archive_dates: List[str]) -> None:
+    """写入共享索引：前端先读取索引，再只下载当前语言的数据"""
+    index = {
+        "schema_version": SCHEMA_VERSION,
+        "last_updated": data.get('last_updated', ''),
+        "has_recent_observations": data.get('has_recent_observations', False),
+        "has_industry_observations": data.get('has_industry_observations', False),
+        "languages": languages,
+        "archive": {
+            "dir": "archive",
+            "dates": archive_dates
+        },
+        "trends": TRENDS_FILE.name if TRENDS_FILE.exists() else None
+    }
+    write_json(INDEX_FILE, index)
+
+
+def load_trends() -> Dict:
+    """读取趋势统计文件（不存在或版本不匹配时返回空统计）"""
+    if TRENDS_FILE.exists():
+        try:
+            with open(TRENDS_FILE, 'r', encoding='utf-8') as f:
+                trends = json.load(f)
+            if trends.get('schema_version') == SCHEMA_VERSION:
+                return trends
+        except Exception as e:
+            print(f"⚠ 读取趋势统计失败: {e}，将重新开始统计")
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "last_updated": "",
+        # 每天的计数：total、type、region、industry、source，以及 region_industry（"地区|行业"）
+        "days": {}
+    }
+
+
+def _trend_labels(item: Dict, obs_type: str, region: Optional[str]) -> Dict[str, str]:
+    """获取新闻项的统计维度；旧归档项没有元数据时，从 text 的 "[DD-MM-YY · 标签]" 中解析"""
+    match = re.match(r'\[[^\]·]*·\s*([^\]]+)\]', item.get('text', ''))
+    label = match.group(1).strip() if match else None
+    industry = item.get('industry') or (label if obs_type == 'industry' and label else '其他')
+    return {
+        'type': obs_type,
+        'region': region or item.get('region') or '未知',
+        'industry': industry,
+        'source': item.get('source') or '未知'
+    }
+
+
+def add_to_trends(trends: Dict, date_key: str, obs_type: str, item: Dict, region: Optional[str] = None,
+                  counted_links: Optional[Set[str]] = None) -> None:
+    """把一条新闻计入某一天的统计（obs_type: 'policy' 或 'industry'）
+
+    同一条新闻可能被路由到多个地区：total/type/industry/source 每天每个link只计一次
+    （counted_links 记录当天已计入的link），region/region_industry 按每个地区计入。
+    """
+    day = trends['days'].setdefault(date_key, {'total': 0})
+    labels = _trend_labels(item, obs_type, region)
+    dimensions = ['region', 'region_industry']
+    link = item.get('link')
+    if counted_links is None or not link or link not in counted_links:
+        day['total'] += 1
+        dimensions += ['type', 'industry', 'source']
+        if counted_links is not None and link:
+            counted_links.add(link)
+    labels['region_industry'] = f"{labels['region']}|{labels['industry']}"
+    for dimension, label in labels.items():
+        if dimension in dimensions:
+            counts = day.setdefault(dimension, {})
+            counts[label] = counts.get(label, 0) + 1
+
+
+def save_trends(trends: Dict) -> None:
+    """导出紧凑的趋势时间序列文件（按日期排序）"""
+    trends['days'] = dict(sorted(trends['days'].items()))
+    trends['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    write_json(TRENDS_FILE, trends, compact=True)
+
+
+def rebuild_trends() -> None:
+    """从全部归档文件重建趋势统计（首次启用或统计文件损坏时使用）"""
+    trends = load_trends()
+    trends['days'] = {}
+    archive_files = sorted(ARCHIVE_DIR.glob("????-??-??.json")) if ARCHIVE_DIR.exists() else []
+    for archive_file in archive_files:
+        try:
+            with open(archive_file, 'r', encoding='utf-8') as f:
+                archive_data = json.load(f)
+        except Exception as e:
+            print(f"⚠ 读取归档失败 {archive_file.name}: {e}")
+            continue
+        counted_links = set()
+        for region, items in archive_data.get('recent_observations', {}).items():
+            for item in items:
+                add_to_trends(trends, archive_file.stem, 'policy', item, region, counted_links)
+        for item in archive_data.get('industry_observations', []):
+            add_to_trends(trends, archive_file.stem, 'industry', item, counted_links=counted_links)
+    save_trends(trends)
+    print(f"✓ 已从 {len(archive_files)} 个归档文件重建趋势统计: {TRENDS_FILE}")
+
+
+def archive_old_news(current_data: Dict, split_languages: bool = False) -> None:
+    """归档超过3天的新闻（split_languages 为 True 时同时写入分语言归档）"""
+    # 确保归档目录存在
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # 读取当前数据
+    if not OUTPUT_FILE.exists():
+        return
+    
+    try:
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            old_data = json.load(f)
+    except:
+        return
+    
+    if not old_data:
+        return
+    
+    # 获取当前日期
+    today = datetime.now()
+    
+    # 归档所有超过3天的新闻
+    # 检查过去7天的数据，确保不会漏掉任何日期
+    archived_dates = set()
+    
+    # 收集所有需要归档的新闻（超过3天）
+    news_to_archive_by_date = {}  # {date: {recent_observations: {...}, industry_observations: [...]}}
+    
+    # 地区以数据文件为准（地区路由表可能增减地区）
+    regions = list(old_data.get('recent_observations', {}).keys())
+    
+    # 处理近期观察
+    for region in regions:
+        for item in old_data.get('recent_observations', {}).get(region, []):
+            # 从日期字符串解析日期（格式：DD-MM-YY）
+            date_str = item.get('date', '')
+            if not date_str:
+                continue
+            
+            try:
+                # 解析日期 DD-MM-YY
+                parts = date_str.split('-')
+                if len(parts) == 3:
+                    day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
+                    # 处理年份：YY -> 20YY
+                    if year < 100:
+                        year += 2000
+                    news_date = datetime(year, month, day)
+                    
+                    # 计算天数差
+                    days_diff = (today - news_date).days
+                    
+                    # 如果超过3天，需要归档
+                    if days_diff > 3:
+                        date_key = news_date.strftime("%Y-%m-%d")
+                        if date_key not in news_to_archive_by_date:
+                            news_to_archive_by_date[date_key] = {
+                                'recent_observations': {r: [] for r in regions},
+                                'industry_observations': []
+                            }
+                        news_to_archive_by_date[date_key]['recent_observations'][region].append(item)
+                        archived_dates.add(date_key)
+            except:
+                continue
+    
+    # 处理行业观察
+    for item in old_data.get('industry_observations', []):
+        date_str = item.get('date', '')
+        if not date_str:
+            continue
+        
+        try:
+            # 解析日期 DD-MM-YY
+            parts = date_str.split('-')
+            if len(parts) == 3:
+                day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
+                # 处理年份：YY -> 20YY
+                if year < 100:
+                    year += 2000
+                news_date = datetime(year, month, day)
+                
+                # 计算天数差
+                days_diff = (today - news_date).days
+                
+                # 如果超过3天，需要归档
+                if days_diff > 3:
+                    date_key = news_date.strftime("%Y-%m-%d")
+                    if date_key not in news_to_archive_by_date:
+                        news_to_archive_by_date[date_key] = {
+                            'recent_observations': {r: [] for r in regions},
+                            'industry_observations': []
+                        }
+                    news_to_archive_by_date[date_key]['industry_observations'].append(item)
+                    archived_dates.add(date_key)
+        except:
+            continue
+    
+    # 趋势统计随归档增量更新（只统计新进入归档的新闻）
+    trends = load_trends() if archived_dates else None
+    
+    # 为每个日期创建归档文件（合并到已有文件或创建新文件）
+    for date_key in archived_dates:
+        archive_file = ARCHIVE_DIR / f"{date_key}.json"
+        
+        # 读取已有归档文件（如果存在）
+        existing_archive = {}
+        if archive_file.exists():
+            try:
+                with open(archive_file, 'r', encoding='utf-8') as f:
+                    existing_archive = json.load(f)
+            except:
+                existing_archive = {}
+        
+        # 合并数据
+        archive_data = news_to_archive_by_date[date_key]
+        
+        # 已归档的新闻之前已计入统计（路由到多个地区的新闻只计一次）
+        counted_links = {
+            item.get('link')
+            for items in existing_archive.get('recent_observations', {}).values()
+            for item in items
+        }
+        counted_links.update(item.get('link') for item in existing_archive.get('industry_observations', []))
+        
+        # 合并近期观察
+        for region in regions:
+            existing_items = existing_archive.get('recent_observations', {}).get(region, [])
+            new_items = archive_data['recent_observations'][region]
+            # 去重（基于link）
+            existing_links = {item.get('link') for item in existing_items}
+            for item in new_items:
+                if item.get('link') not in existing_links:
+                    existing_items.append(item)
+                    existing_links.add(item.get('link'))
+                    add_to_trends(trends, date_key, 'policy', item, region, counted_links)
+            
+            if 'recent_observations' not in existing_archive:
+                existing_archive['recent_observations'] = {}
+            existing_archive['recent_observations'][region] = existing_items
+        
+        # 合并行业观察
+        existing_industry = existing_archive.get('industry_observations', [])
+        new_industry = archive_data['industry_observations']
+        # 去重（基于link）
+        existing_industry_links = {item.get('link') for item in existing_industry}
+        for item in new_industry:
+            if item.get('link') not in existing_industry_links:
+                existing_industry.append(item)
+                existing_industry_links.add(item.get('link'))
+                add_to_trends(trends, date_key, 'industry', item, counted_links=counted_links)
+        existing_archive['industry_observations'] = existing_industry
+        
+        # 添加元数据
+        existing_archive['archived_date'] = date_key
+        existing_archive['last_updated'] = old_data.get('last_updated', '')
+        
+        # 保存归档文件
+        with open(archive_file, 'w', encoding='utf-8') as f:
+            json.dump(existing_archive, f, ensure_ascii=False, indent=2)
+        if split_languages:
+            write_split_files(existing_archive, archive_file)
+        print(f"✓ 已归档 {date_key} 的数据到 {archive_file}")
+    
+    if archived_dates:
+        save_trends(trends)
+        print(f"✓ 共归档 {len(archived_dates)} 个日期的数据: {', '.join(sorted(archived_dates))}")
+        print(f"✓ 已更新趋势统计: {TRENDS_FILE}")
+
+
+def filter_recent_output(output_data: Dict, days: int = 3) -> Dict:
+    """从显示数据中移除已归档的新闻（超过days天的），并重新设置标志"""
+    today = datetime.now()
+    regions = list(output_data['recent_observations'].keys())
+    filtered_output = {
+        'recent_observations': {region: [] for region in regions},
+        'industry_observations': [],
+        'last_updated': output_data['last_updated'],
+        'has_recent_observations': False,
+        'has_industry_observations': False
+    }
+    
+    def is_recent(item: Dict) -> bool:
+        date_str = item.get('date', '')
+        if not date_str:
+            # 如果没有日期，保留该项
+            return True
+        try:
+            parts = date_str.split('-')
+            if len(parts) == 3:
+                day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
+                if year < 100:
+                    year += 2000
+                news_date = datetime(year, month, day)
+                return (today - news_date).days <= days
+        except:
+            # 如果日期解析失败，保留该项
+            return True
+        return False
+    
+    # 过滤近期观察和行业观察
+    for region in regions:
+        for item in output_data.get('recent_observations', {}).get(region, []):
+            if is_recent(item):
+                filtered_output['recent_observations'][region].append(item)
+    for item in output_data.get('industry_observations', []):
+        if is_recent(item):
+            filtered_output['industry_observations'].append(item)
+    
+    # 设置标志
+    filtered_output['has_recent_observations'] = any(
+        len(items) > 0 for items in filtered_output['recent_observations'].values()
+    )
+    filtered_output['has_industry_observations'] = len(filtered_output['industry_observations']) > 0
+    return filtered_output
+
+
+# 抓取函数：(url, fetch_config, window_start) -> 逐条产出窗口内的RSS条目
+Fetcher = Callable[[str, Dict, datetime], Iterator[Dict]]
+
+
+class NewsPipeline:
+    """新闻抓取流水线：一个实例可以多次运行，每次运行使用独立的成本统计和预算
+
+    - config：data-sources.json 的内容；不传时第一次使用时才读取文件
+    - fetcher：RSS抓取函数，默认 iter_feed_entries（测试或回填时可替换为本地数据）
+    - llm：OpenAI兼容的客户端（需要 chat.completions.create）；不传时第一次需要时才创建
+    - keyword_only：只使用关键词筛选，不翻译，也不导入 openai
+    """
+
+    def __init__(self, config: Optional[Dict] = None, fetcher: Optional[Fetcher] = None,
+                 llm=None, api_key: Optional[str] = None, keyword_only: bool = False):
+        self._config = config
+        self.fetcher = fetcher or iter_feed_entries
+        # 只用关键词时忽略注入的客户端；注入了客户端或只用关键词时不再创建客户端
+        self._llm = None if keyword_only else llm
+        self._llm_resolved = llm is not None or keyword_only
+        self.api_key = api_key
+        self.keyword_only = keyword_only
+        # 每次 collect() 开始时按配置重置
+        self.cost_tracker = new_cost_tracker()
+        self.budget = BudgetController(cost_tracker=self.cost_tracker)
+
+    @property
+    def config(self) -> Dict:
+        if self._config is None:
+            self._config = load_config()
+        return self._config
+
+    @property
+    def llm(self):
+        """OpenAI客户端（第一次访问时创建；没有API密钥或只用关键词时为None）"""
+        if not self._llm_resolved:
+            self._llm = create_openai_client(self.api_key)
+            self._llm_resolved = True
+        return self._llm
+
+    def reset(self) -> None:
+        """开始新的一次运行：重置成本统计，按配置重新开始预算计时"""
+        self.cost_tracker = new_cost_tracker()
+        self.budget = BudgetController(self.config.get('budget', {}), self.cost_tracker)
+
+    def check_relevance(self, title: str, summary: str, prompt: str) -> bool:
+        """使用AI判断新闻相关性"""
+        if not self.llm:
+            return True  # 如果没有AI，默认通过
+        
+        try:
+            full_text = f"标题：{title}\n摘要：{summary[:300]}"
+            response = self.llm.chat.completions.create(
+                model="gpt-4o-mini",  # 使用更便宜的模型
+                messages=[
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": full_text}
+                ],
+                temperature=0.1,
+                max_tokens=10,
+                timeout=self.budget.request_timeout()
+            )
+            self.budget.record(response, 'ai_filter')
+            result = response.choices[0].message.content.strip().lower()
+            is_relevant = "relevant" in result and "not relevant" not in result
+            if not is_relevant:
+                print(f"  ✗ AI筛选排除: {title[:60]}...")
+            return is_relevant
+        except Exception as e:
+            print(f"⚠ AI筛选出错: {e}，使用关键词筛选")
+            return True
+
+    def translate_texts_routed(self, texts: List[str], target_lang: str = "中文") -> List[str]:
+        """只把唯一的、非中文的文本发送给翻译API，再把结果映射回每个原始位置"""
+        unique_texts, positions = route_translation_texts(texts)
+        skipped = sum(1 for pos in positions if pos is None)
+        duplicates = len(texts) - skipped - len(unique_texts)
+        if skipped or duplicates:
+            print(f"  翻译路由：{len(texts)} 条 -> {len(unique_texts)} 条（跳过中文/空文本 {skipped} 条，重复 {duplicates} 条）")
+        translated = self.translate_text_batch(unique_texts, target_lang) if unique_texts else []
+        return [text if pos is None else translated[pos] for text, pos in zip(texts, positions)]
+
+    def translate_text_batch(self, texts: List[str], target_lang: str = "中文") -> List[str]:
+        """批量翻译文本（优化API调用）"""
+        if not self.llm or not texts:
+            return texts
+        
+        try:
+            # 将多个文本合并为一次API调用
+            combined_text = "\n---\n".join([f"{i+1}. {text}" for i, text in enumerate(texts)])
+            
+            prompt = f"将以下英文文本翻译成{target_lang}，保持专业术语的准确性。每个条目用---分隔，请按相同格式返回翻译结果，只返回翻译后的文本，不要其他内容。"
+            
+            response = self.llm.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": combined_text}
+                ],
+                temperature=0.3,
+                max_tokens=2000,
+                timeout=self.budget.request_timeout(60)
+            )
+            
+            # 成本监控
+            self.budget.record(response, 'translation')
+            
+            translated = response.choices[0].message.content.strip()
+            
+            # 分割翻译结果
+            results = [line.strip() for line in translated.split("---") if line.strip()]
+            
+            # 移除编号前缀（如 "1. "）
+            results = [re.sub(r'^\d+\.\s*', '', result) for result in results]
+            
+            # 确保返回数量匹配
+            if len(results) == len(texts):
+                return results
+            else:
+                print(f"⚠ 翻译数量不匹配：期望 {len(texts)}，得到 {len(results)}")
+                # 如果数量不匹配，返回原文
+                return texts
+                
+        except Exception as e:
+            print(f"⚠ 批量翻译出错: {e}，返回原文")
+            return texts
+
+    def translate_news_items(self, news_items: List[Dict], checkpoint: Optional[RunCheckpoint] = None) -> List[Dict]:
+        """翻译新闻项（标题+摘要），已翻译的结果从检查点恢复"""
+        checkpoint = checkpoint or RunCheckpoint()
+        done = checkpoint.load('translations', {})
+        pending = []
+        for item in news_items:
+            if item['link'] in done:
+                item.update(done[item['link']])
+            else:
+                pending.append(item)
+        if len(pending) < len(news_items):
+            print(f"  从检查点恢复 {len(news_items) - len(pending)} 条翻译")
+        if not pending:
+            return news_items
+        
+        self._translate_items(pending)
+        
+        # 翻译失败时会返回原文，这类结果不写入检查点，恢复时重试
+        for item in pending:
+            if 'title_zh' in item and item['title_zh'] != item['title']:
+                done[item['link']] = {'title_zh': item['title_zh'], 'summary_zh': item.get('summary_zh', '')}
+        checkpoint.save('translations', done)
+        return news_items
+
+    def _translate_items(self, news_items: List[Dict]) -> List[Dict]:
+        """调用API翻译新闻项"""
+        if not self.llm:
+            return news_items
+        
+        # 预算即将用完时跳过剩余翻译（显示时回退到原文）
+        if not self.budget.allows_fetching():
+            print(f"  ⚠ 预算不足，跳过 {len(news_items)} 条新闻的翻译")
+            return news_items
+        
+        # 收集需要翻译的文本
+        titles = [item['title'] for item in news_items]
+        summaries = [item.get('summary', '') for item in news_items]
+        
+        print(f"  翻译 {len(news_items)} 条新闻...")
+        
+        # 批量翻译标题（跳过中文标题，重复标题只翻译一次）
+        titles_zh = self.translate_texts_routed(titles, "中文")
+        
+        # 批量翻译摘要（空摘要、中文摘要和重复摘要不发送；预算紧张时跳过摘要翻译）
+        if any(summaries) and not self.budget.allows_summary_translation():
+            print(f"  ⚠ 预算紧张，跳过摘要翻译")
+            summaries_zh_full = summaries
+        else:
+            summaries_zh_full = self.translate_texts_routed(summaries, "中文")
+        
+        # 更新新闻项
+        for i, item in enumerate(news_items):
+            item['title_zh'] = titles_zh[i] if i < len(titles_zh) else item['title']
+            item['summary_zh'] = summaries_zh_full[i] if i < len(summaries_zh_full) else item.get('summary', '')
+        
+        return news_items
+
+    def fetch_source_entries(self, source: Dict, fetch_config: Dict, window_start: datetime,
+                             checkpoint: RunCheckpoint) -> List[Dict]:
+        """获取单个数据源的窗口内条目（已抓取的数据源从检查点恢复）"""
+        fetched = checkpoint.load('fetched', {})
+        if source['name'] in fetched:
+            print(f"  从检查点恢复 {len(fetched[source['name']])} 条新闻")
+            return [deserialize_entry(data) for data in fetched[source['name']]]
+        
+        entries = []
+        source_fetch_config = dict(fetch_config, timeout=self.budget.request_timeout(fetch_config['timeout']),
+                                   deadline=self.budget.fetch_deadline())
+        for entry in self.fetcher(source['url'], source_fetch_config, window_start):
+            if not self.budget.allows_fetching():
+                break
+            entries.append(serialize_entry(entry))
+        else:
+            # 只有完整读取的数据源才写入检查点；被预算中断的数据源恢复时重新抓取
+            fetched[source['name']] = entries
+            checkpoint.save('fetched', fetched)
+        return [deserialize_entry(data) for data in entries]
+
+    def collect_candidates(self, sources: List[Dict], checkpoint: RunCheckpoint) -> List[Dict]:
+        """阶段1-2：抓取所有数据源，并进行去重、关键词和排除词预筛选"""
+        if checkpoint.is_completed('filtered'):
+            candidates = [deserialize_item(data) for data in checkpoint.load('filtered', [])]
+            print(f"\n从检查点恢复 {len(candidates)} 条候选新闻，跳过抓取")
+            return candidates
+        
+        # 流式抓取：只保留选择窗口内的新闻，并限制正文长度
+        fetch_config = get_fetch_config(self.config)
+        window_start = get_window_start(fetch_config['window_days'])
+        
+        # 用于去重的URL集合
+        seen_urls: Set[str] = set()
+        candidates = []
+        
+        for source in sources:
+            # 预算即将用完：停止抓取，使用已有结果生成输出
+            if not self.budget.allows_fetching():
+                print(f"\n⚠ 预算即将用完，停止抓取剩余数据源")
+                break
+            
+            source_type = source.get('type', 'media')  # 'policy' 或 'media'
+            region = source.get('region', '')
+            
+            print(f"\n处理: {source['name']} ({region}, {source_type})")
+            try:
+                entries = self.fetch_source_entries(source, fetch_config, window_start, checkpoint)
+                print(f"  找到 {len(entries)} 条窗口内新闻")
+                if len(entries) == 0:
+                    print(f"  ⚠ 警告：该RSS源可能无效、无法访问或近期没有更新")
+                    continue
+                
+                matched_count = 0
+                for entry in entries:
+                    title = entry.get('title', '')
+                    summary = extract_summary(entry)
+                    link = entry.get('link', '#')
+                    
+                    # URL去重
+                    if link in seen_urls:
+                        continue
+                    seen_urls.add(link)
+                    
+                    # 获取新闻日期
+                    news_date = get_news_date(entry)
+                    date = news_date.strftime("%d-%m-%y") if news_date else format_date(entry.get('published', ''))
+                    
+                    # 时效性检查：优先当天，不足时扩展到2-3天
+                    is_today = is_within_date_range(news_date, days=0)
+                    is_yesterday = is_within_date_range(news_date, days=1)
+                    is_day_before = is_within_date_range(news_date, days=2)
+                    
+                    # 暂时不进行日期过滤，等收集完后再决定
+                    # 先收集所有新闻，然后根据数量决定是否扩展日期范围
+                    
+                    # 关键词筛选（如果关键词列表为空，则跳过筛选）
+                    keywords = source.get('keywords', [])
+                    if keywords and len(keywords) > 0:
+                        if not check_keywords(f"{title} {summary}", keywords):
+                            continue
+                    
+                    matched_count += 1
+                    
+                    # 预筛选：直接排除明显不相关的内容（在AI筛选之前）
+                    # 只排除明显不适合企业网站的内容，让AI判断政策相关性
+                    title_lower = title.lower()
+                    summary_lower = summary.lower()
+                    combined_text = f"{title_lower} {summary_lower}"
+                    
+                    # 排除关键词列表（这些内容明显不适合企业网站）
+                    exclude_keywords = [
+                        'traffic accident', 'car crash', 'motorcycle accident', 'road accident', 'motorcyclist',  # 交通事故
+                        'safe deposit box', 'safe deposit', 'insurance box', 'treasure', 'gold bars', 'jewellery',  # 保险柜
+                        'cord blood', 'umbilical cord', 'cordlife', 'cord blood banking',  # 脐带血
+                        'actor', 'actress', 'celebrity charged', 'entertainment',  # 娱乐明星（仅限犯罪相关）
+                        'grievous injury', 'charged with grievous',  # 个人犯罪/事故
+                    ]
+                    
+                    # 检查是否包含排除关键词（精确匹配，避免误判）
+                    if any(keyword in combined_text for keyword in exclude_keywords):
+                        continue
+                    
+                    # 对于农业新闻，除非明确涉及重大政策、投资或经济特区，否则排除
+                    # 农业政策目标、农业支持措施等通常不够相关
+                    if any(kw in combined_text for kw in ['farming', 'agriculture', 'farm goal', 'farm support']):
+                        # 只保留涉及重大政策框架、投资政策、经济特区的农业新闻
+                        if not any(kw in combined_text for kw in ['economic zone', 'investment policy', 'trade policy', 'economic policy', 'major policy', 'policy framework']):
+                            continue
+                    
+                    candidates.append({
+                        "date": date,
+                        "date_obj": news_date,  # 保存datetime对象用于日期过滤（不序列化到JSON）
+                        "title": title,
+                        "link": link,
+                        "summary": summary[:200] if summary else "",
+                        "full_summary": summary,  # 用于AI筛选和行业分类（不输出）
+                        "source": source['name'],
+                        "source_type": source_type,
+                        "priority": source.get('priority', 999),
+                        "region": region,
+                        "is_today": is_today,
+                        "is_yesterday": is_yesterday,
+                        "is_day_before": is_day_before
+                    })
+                
+                print(f"  通过筛选: {matched_count} 条")
+            
+            except ImportError:
+                # 缺少依赖库不是单个数据源的问题：中止运行，不能用空结果覆盖已有数据
+                raise
+            except Exception as e:
+                print(f"  ✗ 错误: {e}")
+                continue
+        
+        # 预算中断了抓取时不标记完成，恢复时继续抓取未完成的数据源（预算等级只升不降）
+        if self.budget.allows_fetching():
+            checkpoint.save('filtered', [serialize_item(item) for item in candidates])
+            checkpoint.mark_completed('fetched')
+            checkpoint.mark_completed('filtered')
+        return candidates
+
+    def apply_ai_filter(self, candidates: List[Dict], checkpoint: RunCheckpoint,
+                        router: RegionRouter) -> Tuple[List[Dict], List[Dict]]:
+        """阶段3：AI筛选并分类为政策类和行业类（已有的AI判断从检查点恢复）"""
+        config = self.config
+        ai_config = config.get('ai_filtering', {})
+        ai_enabled = ai_config.get('enabled', False) and self.llm is not None
+        policy_prompt = ai_config.get('prompt_policy', '')
+        industry_prompt = ai_config.get('prompt_industry', '')
+        
+        verdicts = checkpoint.load('verdicts', {})
+        if verdicts:
+            print(f"\n从检查点恢复 {len(verdicts)} 条AI筛选结果")
+        
+        def is_relevant(news_item: Dict, prompt: str) -> bool:
+            key = f"{news_item['source_type']}:{news_item['link']}"
+            if key not in verdicts:
+                verdicts[key] = self.check_relevance(news_item['title'], news_item['full_summary'], prompt)
+                checkpoint.save('verdicts', verdicts)
+            return verdicts[key]
+        
+        # 分别收集政策类和行业类新闻
+        policy_news = []  # 政策类新闻（按地区分类）
+        industry_news = []  # 行业类新闻（按行业分类）
+        
+        for candidate in candidates:
+            # 预算即将用完：剩余候选新闻已经抓取完毕，不再调用AI，只按关键词分类
+            if ai_enabled and not self.budget.allows_fetching():
+                print(f"\n⚠ 预算即将用完，剩余候选新闻只使用关键词筛选")
+                ai_enabled = False
+            
+            news_item = dict(candidate)
+            title = news_item['title']
+            summary = news_item.pop('full_summary')
+            source_type = news_item.pop('source_type')
+            priority = news_item.pop('priority')
+            region = news_item['region']
+            
+            # 根据数据源类型和AI筛选进行分类
+            # 预算紧张时低优先级数据源只使用关键词筛选
+            use_ai = ai_enabled and self.budget.allows_ai_filter({'priority': priority})
+            
+            if source_type == 'policy':
+                # 政策类：使用政策提示词筛选（所有地区都严格筛选）
+                if use_ai and policy_prompt:
+                    if not is_relevant(candidate, policy_prompt):
+                        continue
+                
+                # 行业标签用于趋势统计（政策类新闻不按行业展示）
+                industry = classify_industry(title, summary, config.get('industry_keywords', {}))
+                if industry:
+                    news_item['industry'] = industry
+                
+                # 政策类新闻进入recent_observations
+                # 区域性数据源（如东盟）的新闻按标题提到的地区分配，可同时进入多个地区
+                regions = router.route(region, title)
+                for routed_region in regions:
+                    policy_news.append(dict(news_item, region=routed_region))
+                if regions and regions != [region]:
+                    print(f"  ✓ 政策类新闻 -> {'/'.join(regions)}: {title[:60]}...")
+            
+            else:
+                # 行业类：使用行业提示词筛选
+                if use_ai and industry_prompt:
+                    if not is_relevant(candidate, industry_prompt):
+                        continue
+                
+                # 行业分类
+                industry = classify_industry(title, summary, config.get('industry_keywords', {}))
+                if industry:
+                    news_item['industry'] = industry
+                # 如果没有匹配到具体行业，但通过了筛选，也可以作为行业新闻
+                industry_news.append(news_item)
+        
+        checkpoint.mark_completed('verdicts')
+        return policy_news, industry_news
+
+    def fetch_and_filter_news(self, checkpoint: Optional[RunCheckpoint] = None) -> Dict:
+        """抓取并筛选新闻，区分政策类和行业类（各阶段结果写入检查点）"""
+        config = self.config
+        checkpoint = checkpoint or RunCheckpoint()
+        target_counts = config.get('target_daily_count', {})
+        router = RegionRouter(config.get('regions'), target_counts.get('policy', {}).get('per_region', 5))
+        all_news = {
+            "recent_observations": router.empty_observations(),
+            "industry_observations": []
+        }
+        
+        # 获取配置
+        sources = [s for s in config['sources'] if s.get('enabled', True)]
+        # 按优先级排序（priority越小越优先）
+        sources.sort(key=lambda x: x.get('priority', 999))
+        
+        policy_target = target_counts.get('policy', {'min': 6, 'max': 10})
+        industry_target = target_counts.get('industry', {'min': 12, 'max': 20})
+        
+        print(f"\n开始抓取 {len(sources)} 个数据源...")
+        print(f"目标：政策类 {policy_target['min']}-{policy_target['max']} 条，行业类 {industry_target['min']}-{industry_target['max']} 条")
+        
+        candidates = self.collect_candidates(sources, checkpoint)
+        policy_news, industry_news = self.apply_ai_filter(candidates, checkpoint, router)
+        
+        # 按日期排序（最新的在前）
+        policy_news.sort(key=lambda x: x.get('date_obj') or datetime.min, reverse=True)
+        industry_news.sort(key=lambda x: x.get('date_obj') or datetime.min, reverse=True)
+        
+        # 时效性过滤：优先当天，不足时扩展到2-3天
+        # 先筛选当天的政策类新闻
+        today_policy = [item for item in policy_news if item.get('is_today', False)]
+        today_industry = [item for item in industry_news if item.get('is_today', False)]
+        
+        # 调试：统计policy_news中的地区分布
+        policy_region_counts = {}
+        for item in policy_news:
+            region = item.get('region', '未知')
+            policy_region_counts[region] = policy_region_counts.get(region, 0) + 1
+        print(f"\n调试：policy_news地区分布: {policy_region_counts}")
+        print(f"调试：today_policy数量: {len(today_policy)}")
+        
+        # 如果当天新闻不足，扩展到昨天和前天
+        if len(today_policy) < 10:  # 政策类目标10条
+            yesterday_policy = [item for item in policy_news if item.get('is_yesterday', False) and item not in today_policy]
+            day_before_policy = [item for item in policy_news if item.get('is_day_before', False) and item not in today_policy]
+            policy_news_filtered = today_policy + yesterday_policy + day_before_policy
+            if len(policy_news_filtered) > 0:
+                print(f"  时效性：当天 {len(today_policy)} 条，扩展到2-3天，共 {len(policy_news_filtered)} 条")
+            else:
+                # 如果仍然没有，使用所有新闻（可能是日期解析问题）
+                print(f"  时效性：当天 {len(today_policy)} 条，扩展到2-3天后仍为0，使用所有新闻")
+                policy_news_filtered = policy_news[:10]  # 至少取前10条
+        else:
+            policy_news_filtered = today_policy
+            print(f"  时效性：当天 {len(today_policy)} 条，足够")
+        
+        if len(today_industry) < 20:  # 行业类目标20条
+            yesterday_industry = [item for item in industry_news if item.get('is_yesterday', False) and item not in today_industry]
+            day_before_industry = [item for item in industry_news if item.get('is_day_before', False) and item not in today_industry]
+            industry_news_filtered = today_industry + yesterday_industry + day_before_industry
+            if len(industry_news_filtered) > 0:
+                print(f"  时效性：当天 {len(today_industry)} 条，扩展到2-3天，共 {len(industry_news_filtered)} 条")
+            else:
+                # 如果仍然没有，使用所有新闻（可能是日期解析问题）
+                print(f"  时效性：当天 {len(today_industry)} 条，扩展到2-3天后仍为0，使用所有新闻")
+                industry_news_filtered = industry_news[:20]  # 至少取前20条
+        else:
+            industry_news_filtered = today_industry
+            print(f"  时效性：当天 {len(today_industry)} 条，足够")
+        
+        # 分配政策类新闻到各地区（控制数量：按地区路由表的配额，默认每个地区5条）
+        # 调试：统计policy_news_filtered中的地区分布
+        region_counts = {}
+        for item in policy_news_filtered:
+            region = item.get('region', '未知')
+            region_counts[region] = region_counts.get(region, 0) + 1
+        print(f"\n调试：policy_news_filtered地区分布: {region_counts}")
+        
+        policy_items_to_translate = []
+        for item in policy_news_filtered:
+            region = item.get('region', '')
+            if region in all_news['recent_observations']:
+                current_count = len(all_news['recent_observations'][region])
+                if current_count < router.quotas[region]:
+                    all_news['recent_observations'][region].append(item)
+                    policy_items_to_translate.append(item)
+                    print(f"  ✓ 分配到{region}: {item.get('title', '')[:60]}...")
+        
+        # 分配行业类新闻（控制数量）
+        industry_items_to_translate = []
+        for item in industry_news_filtered:
+            if len(all_news['industry_observations']) < industry_target['max']:
+                all_news['industry_observations'].append(item)
+                industry_items_to_translate.append(item)
+        
+        # 翻译新闻（标题+摘要）
+        if self.llm:
+            print("\n开始翻译新闻...")
+            if policy_items_to_translate:
+                self.translate_news_items(policy_items_to_translate, checkpoint)
+            if industry_items_to_translate:
+                self.translate_news_items(industry_items_to_translate, checkpoint)
+            checkpoint.mark_completed('translations')
+            print("✓ 翻译完成")
+        
+        # 最终统计
+        total_policy = sum(len(items) for items in all_news['recent_observations'].values())
+        total_industry = len(all_news['industry_observations'])
+        
+        print(f"\n筛选结果：")
+        print(f"  政策类: {total_policy} 条（目标: {policy_target['min']}-{policy_target['max']}）")
+        print(f"  行业类: {total_industry} 条（目标: {industry_target['min']}-{industry_target['max']}）")
+        
+        return all_news
+
+    def collect(self, checkpoint: Optional[RunCheckpoint] = None) -> Dict:
+        """抓取、筛选、翻译并生成显示格式（只保留3天内的新闻），不写任何输出文件"""
+        self.reset()
+        news_data = self.fetch_and_filter_news(checkpoint)
+        return filter_recent_output(generate_display_format(news_data))
+
+    def run(self, resume: bool = False) -> Dict:
+        """完整运行一次：归档旧新闻、抓取筛选、写入数据文件，返回写入的数据"""
+        # 先检查依赖：缺少feedparser时在归档或写入任何数据之前抛出ImportError
+        _import_feedparser()
+        split_languages = self.config.get('output', {}).get('split_languages', False)
+        
+        # 归档旧新闻（在抓取新新闻之前）
+        if OUTPUT_FILE.exists():
+            print("\n检查需要归档的新闻...")
+            try:
+                with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                    old_data = json.load(f)
+                archive_old_news(old_data, split_languages)
+            except Exception as e:
+                print(f"⚠ 归档检查出错: {e}")
+        
+        # 抓取和筛选新闻（各阶段结果写入检查点，中断后可用 --resume 继续）
+        checkpoint = RunCheckpoint.start(resume=resume)
+        filtered_output = self.collect(checkpoint)
+        
+        # 确保输出目录存在
+        OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 保存JSON文件（只包含3天内的新闻）
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(filtered_output, f, ensure_ascii=False, indent=2)
+        
+        print(f"\n✓ 完成！已生成 {OUTPUT_FILE}")
+        
+        # 分语言输出：前端只下载当前语言的数据
+        if split_languages:
+            languages = write_split_files(filtered_output, OUTPUT_FILE)
+            write_index_file(filtered_output, languages, ensure_split_archives())
+            print(f"✓ 已生成分语言数据: {', '.join(entry['file'] for entry in languages.values())}")
+        elif INDEX_FILE.exists():
+            # 关闭分语言输出后删除旧索引，前端回退到合并数据文件（否则会一直读取旧的分语言文件）
+            INDEX_FILE.unlink()
+            print(f"✓ 已删除分语言索引: {INDEX_FILE}")
+        
+        # 运行成功，检查点不再需要
+        checkpoint.finish()
+        for region, items in filtered_output['recent_observations'].items():
+            print(f"  {region}: {len(items)} 条")
+        print(f"  行业观察: {len(filtered_output['industry_observations'])} 条")
+        print(f"  更新时间: {filtered_output['last_updated']}")
+        
+        self.print_cost_summary()
+        return filtered_output
+
+    def print_cost_summary(self) -> None:
+        """输出本次运行的成本统计"""
+        cost_tracker = self.cost_tracker
+        if cost_tracker['ai_filter_calls'] > 0 or cost_tracker['translation_calls'] > 0:
+            print(f"\n成本统计:")
+            print(f"  AI筛选调用: {cost_tracker['ai_filter_calls']} 次")
+            print(f"  翻译调用: {cost_tracker['translation_calls']} 次")
+            print(f"  输入tokens: {cost_tracker['total_input_tokens']}")
+            print(f"  输出tokens: {cost_tracker['total_output_tokens']}")
+            input_cost = estimate_cost(cost_tracker['total_input_tokens'], 0)
+            output_cost = estimate_cost(0, cost_tracker['total_output_tokens'])
+            total_cost = input_cost + output_cost
+            print(f"  估算成本: ${total_cost:.4f} (输入: ${input_cost:.4f}, 输出: ${output_cost:.4f})")
+        print(f"  运行时间: {self.budget.elapsed():.0f} 秒，预算等级: {self.budget.LEVELS[self.budget.level]}")
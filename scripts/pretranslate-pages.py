@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+静态页面构建时预翻译脚本
+功能：
+1. 从静态页面（index.html、company.html、courses.html 等）提取需要翻译的文本
+2. 通过与前端相同的翻译接口（backend-translation-api）批量翻译
+3. 使用内容哈希缓存，只重新翻译新增或修改过的文本
+4. 为每个页面生成静态翻译词典，前端直接加载，不再在运行时调用翻译API
+5. 生成词典清单（manifest.json），前端只请求清单中列出的词典
+
+用法：
+    python scripts/pretranslate-pages.py                 # 处理所有页面
+    python scripts/pretranslate-pages.py index.html      # 只处理指定页面
+    python scripts/pretranslate-pages.py --dry-run       # 只统计需要翻译的文本
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.request import Request, urlopen
+
+# 配置
+BASE_DIR = Path(__file__).parent.parent
+OUTPUT_DIR = BASE_DIR / "assets/data/translations"
+CACHE_FILE = OUTPUT_DIR / "cache.json"
+MANIFEST_FILE = OUTPUT_DIR / "manifest.json"
+# 与 assets/js/translation-service.js 使用相同的翻译接口
+DEFAULT_ENDPOINT = "https://backend-translation-api.vercel.app/api/translate"
+TARGET_LANG = "en"
+BATCH_SIZE = 20
+SCHEMA_VERSION = 1
+
+# 不参与预翻译的页面（模板和测试页面）
+EXCLUDED_PAGES = {"base.html", "test-news-display.html"}
+
+# 与 assets/js/site-translator.js 的 TRANSLATABLE_SELECTORS 对应
+TRANSLATABLE_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "strong", "a"}
+TRANSLATABLE_CLASSES = {
+    "section-title", "accent-title", "motion-group-item", "highlight-item",
+    "title-link", "link-secondary", "media-title", "media-source"
+}
+# 与 EXCLUDE_SELECTORS 对应：这些元素及其子元素不翻译
+EXCLUDED_IDS = {"malaysia-news", "singapore-news", "industry-news"}
+EXCLUDED_CLASSES = {"lang-switch", "company-name"}
+SKIPPED_TEXT_TAGS = {"script", "style", "noscript", "template"}
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+
+CJK_PATTERN = re.compile(r'[\u3400-\u9fff\uf900-\ufaff]')
+
+
+def normalize_text(text: str) -> str:
+    """规范化空白字符（与前端 normalizeText 保持一致）"""
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def text_hash(text: str) -> str:
+    """文本内容哈希（缓存键）"""
+    return hashlib.sha256(f"{TARGET_LANG}:{text}".encode('utf-8')).hexdigest()[:16]
+
+
+class TranslatableTextParser(HTMLParser):
+    """提取页面中可翻译元素的完整文本（相当于前端的 el.textContent）"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack: List[Dict] = []
+        self.texts: List[str] = []
+
+    def _is_excluded(self, tag: str, classes: set, element_id: str) -> bool:
+        if element_id in EXCLUDED_IDS or classes & EXCLUDED_CLASSES:
+            return True
+        if tag in ("footer", "button") or tag in SKIPPED_TEXT_TAGS:
+            return True
+        # 新闻链接由 insights-loader.js 处理
+        if tag == "a" and any("motion-group-item" in e["classes"] for e in self.stack):
+            return True
+        return any(e["excluded"] for e in self.stack)
+
+    def _is_candidate(self, tag: str, classes: set) -> bool:
+        in_main = any(e["tag"] == "main" for e in self.stack)
+        in_nav = any(e["tag"] == "nav" for e in self.stack)
+        if in_main:
+            return tag in TRANSLATABLE_TAGS or bool(classes & TRANSLATABLE_CLASSES)
+        return in_nav and tag == "a"
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+        excluded = self._is_excluded(tag, classes, attrs.get("id") or "")
+        self.stack.append({
+            "tag": tag,
+            "classes": classes,
+            "excluded": excluded,
+            "candidate": not excluded and self._is_candidate(tag, classes),
+            "parts": []
+        })
+
+    def handle_endtag(self, tag):
+        # 容忍未闭合标签：弹出到匹配的开始标签为止
+        if not any(e["tag"] == tag for e in self.stack):
+            return
+        while self.stack:
+            element = self.stack.pop()
+            if element["candidate"]:
+                text = normalize_text("".join(element["parts"]))
+                if text:
+                    self.texts.append(text)
+            if element["tag"] == tag:
+                break
+
+    def handle_data(self, data):
+        if any(e["tag"] in SKIPPED_TEXT_TAGS for e in self.stack):
+            return
+        for element in self.stack:
+            if element["candidate"]:
+                element["parts"].append(data)
+
+
+def extract_texts(page: Path) -> List[str]:
+    """提取页面中需要翻译的文本（去重，保持页面顺序）"""
+    parser = TranslatableTextParser()
+    parser.feed(page.read_text(encoding='utf-8'))
+    parser.close()
+    return list(dict.fromkeys(parser.texts))
+
+
+def load_cache() -> Dict[str, str]:
+    """加载内容哈希缓存 {hash: translation}"""
+    if not CACHE_FILE.exists():
+        return {}
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('translations', {})
+    except Exception as e:
+        print(f"⚠ 读取翻译缓存失败: {e}，将重新翻译")
+        return {}
+
+
+def save_cache(cache: Dict[str, str]) -> None:
+    """保存内容哈希缓存"""
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"schema_version": SCHEMA_VERSION, "lang": TARGET_LANG, "translations": cache},
+                  f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def call_translation_api(texts: List[str], endpoint: str) -> Optional[List[str]]:
+    """调用翻译接口（与前端 callTranslationAPI 相同的请求格式）"""
+    body = json.dumps({"texts": texts, "targetLang": TARGET_LANG}).encode('utf-8')
+    request = Request(endpoint, data=body, headers={'Content-Type': 'application/json'})
+    try:
+        with urlopen(request, timeout=60) as response:
+            data = json.loads(response.read().decode('utf-8'))
+    except Exception as e:
+        print(f"  ⚠ 翻译接口调用失败: {e}")
+        return None
+    translations = data.get('translations')
+    if not isinstance(translations, list) or len(translations) != len(texts):
+        print(f"  ⚠ 翻译数量不匹配：期望 {len(texts)}，得到 {len(translations or [])}")
+        return None
+    return translations
+
+
+def translate_missing(texts: List[str], cache: Dict[str, str], endpoint: str) -> int:
+    """批量翻译缓存中没有的文本，返回新翻译的数量"""
+    translated_count = 0
+    for start in range(0, len(texts), BATCH_SIZE):
+        batch = texts[start:start + BATCH_SIZE]
+        print(f"  翻译第 {start + 1}-{start + len(batch)} 条（共 {len(texts)} 条）...")
+        translations = call_translation_api(batch, endpoint)
+        if translations is None:
+            continue
+        for text, translation in zip(batch, translations):
+            translation = normalize_text(translation or '')
+            # 接口出错时会原样返回原文，这类结果不缓存，留给下次重试
+            if translation and translation != text:
+                cache[text_hash(text)] = translation
+                translated_count += 1
+    return translated_count
+
+
+def build_page_dictionary(texts: List[str], cache: Dict[str, str]) -> Dict[str, str]:
+    """生成页面翻译词典 {原文: 译文}；不含中文的文本无需翻译"""
+    dictionary = {}
+    for text in texts:
+        if not CJK_PATTERN.search(text):
+            dictionary[text] = text
+        elif text_hash(text) in cache:
+            dictionary[text] = cache[text_hash(text)]
+    return dictionary
+
+
+def write_manifest() -> Dict[str, str]:
+    """根据已生成的词典文件写入清单 {页面: 词典文件}（与 site-translator.js 的 loadStaticTranslations 对应）"""
+    pages = {
+        path.name[:-len(f".{TARGET_LANG}.json")]: path.name
+        for path in sorted(OUTPUT_DIR.glob(f"*.{TARGET_LANG}.json"))
+    }
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"schema_version": SCHEMA_VERSION, "lang": TARGET_LANG, "pages": pages},
+                  f, ensure_ascii=False, indent=2)
+    return pages
+
+
+def get_pages(names: List[str]) -> List[Path]:
+    """获取需要处理的页面"""
+    if names:
+        return [BASE_DIR / name for name in names]
+    return sorted(p for p in BASE_DIR.glob("*.html") if p.name not in EXCLUDED_PAGES)
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="静态页面构建时预翻译")
+    parser.add_argument('pages', nargs='*', help="要处理的页面（默认所有页面）")
+    parser.add_argument('--endpoint', default=os.getenv('TRANSLATION_API_ENDPOINT', DEFAULT_ENDPOINT),
+                        help="翻译接口地址")
+    parser.add_argument('--dry-run', action='store_true', help="只统计需要翻译的文本，不调用接口")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("静态页面预翻译")
+    print("=" * 50)
+
+    pages = get_pages(args.pages)
+    missing_pages = [p.name for p in pages if not p.exists()]
+    if missing_pages:
+        print(f"错误：找不到页面 {', '.join(missing_pages)}")
+        sys.exit(1)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    cache = load_cache()
+
+    # 提取所有页面的文本，跨页面共享的文本（如导航）只翻译一次
+    page_texts = {page: extract_texts(page) for page in pages}
+    all_texts = list(dict.fromkeys(text for texts in page_texts.values() for text in texts))
+    to_translate = [t for t in all_texts if CJK_PATTERN.search(t) and text_hash(t) not in cache]
+
+    print(f"\n共 {len(pages)} 个页面，{len(all_texts)} 条不重复文本")
+    print(f"  缓存命中: {len(all_texts) - len(to_translate)} 条，需要翻译: {len(to_translate)} 条")
+
+    if args.dry_run:
+        for text in to_translate:
+            print(f"  - {text[:60]}")
+        return
+
+    if to_translate:
+        translated_count = translate_missing(to_translate, cache, args.endpoint)
+        save_cache(cache)
+        print(f"✓ 新翻译 {translated_count} 条，已更新缓存 {CACHE_FILE}")
+
+    for page, texts in page_texts.items():
+        dictionary = build_page_dictionary(texts, cache)
+        output_file = OUTPUT_DIR / f"{page.stem}.{TARGET_LANG}.json"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "schema_version": SCHEMA_VERSION,
+                "lang": TARGET_LANG,
+                "page": page.name,
+                "translations": dictionary
+            }, f, ensure_ascii=False, indent=2)
+        print(f"✓ {page.name}: {len(dictionary)}/{len(texts)} 条 -> {output_file.relative_to(BASE_DIR)}")
+
+    manifest_pages = write_manifest()
+    print(f"✓ 词典清单: {len(manifest_pages)} 个页面 -> {MANIFEST_FILE.relative_to(BASE_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
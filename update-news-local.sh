@@ -16,6 +16,9 @@ echo "=========================================="
 python3 scripts/fetch-news.py
 
 if [ $? -eq 0 ]; then
+    # 静态页面预翻译（只翻译新增或修改过的文本；失败不影响新闻更新）
+    python3 scripts/pretranslate-pages.py || echo "⚠ 静态页面预翻译失败，页面将在运行时翻译"
+
     echo ""
     echo "✓ 新闻更新成功！"
     echo "更新时间: $(date '+%Y-%m-%d %H:%M:%S')"